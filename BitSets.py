@@ -0,0 +1,315 @@
+"""
+File: ZF.BitSets
+Author: Aaron Stockdill
+
+The goal of this module is not to be the most efficient representation, but
+to be the most true to the underlying mathematics.
+
+This file contains the BitSet, a Set whose elements are drawn from a fixed
+Universe and recorded as the bits of a Python int. Families of subsets of
+one base set (powersets, relations) can then be combined a word at a time,
+rather than by hashing nested frozensets.
+"""
+
+import sys as _sys
+
+# A little messy to sort out importing for the package or the file.
+try:
+    from .Sets import *
+except SystemError:
+    from Sets import *
+
+
+class Universe(object):
+    """ A fixed, indexed collection of elements for BitSets to draw from.
+    """
+
+    def __init__(self, *elements):
+        """ Create the universe. Repeated elements are only indexed once.
+        """
+        self.elements = tuple(dict.fromkeys(elements))
+        self.index = {e: i for i, e in enumerate(self.elements)}
+        # Each element's contribution to a frozenset hash, so BitSets can
+        # hash like the equivalent Set without building one. Checked
+        # against the interpreter, in case its frozenset hash differs.
+        self._hash_parts = [_shuffle_hash(hash(e)) for e in self.elements]
+        xor = 0
+        for part in self._hash_parts:
+            xor ^= part
+        self._hashes_match = (_frozenset_hash(xor, len(self.elements))
+                              == hash(frozenset(self.elements)))
+
+    def __repr__(self):
+        return "Universe({})".format(", ".join(repr(e) for e in self))
+
+    def __len__(self):
+        """ The number of elements in the universe.
+        """
+        return len(self.elements)
+
+    def __iter__(self):
+        """ Iterate through the elements in index order.
+        """
+        return iter(self.elements)
+
+    def __contains__(self, something):
+        """ Return whether something is an element of the universe.
+        """
+        return something in self.index
+
+    def mask(self, items, strict=True):
+        """ Return the bitmask of items. If the strict flag is set, items
+            outside the universe are an error, otherwise they are ignored.
+        """
+        if isinstance(items, BitSet) and items.universe is self:
+            return items.mask
+        mask = 0
+        for item in items:
+            i = self.index.get(item)
+            if i is not None:
+                mask |= 1 << i
+            elif strict:
+                raise ValueError("{} is not in the universe.".format(item))
+        return mask
+
+    def bitset(self, *items):
+        """ Create a BitSet of items over this universe.
+        """
+        return BitSet(self, *items)
+
+    def bitset_from(self, iterable):
+        """ Create a BitSet over this universe straight from an iterable.
+        """
+        return BitSet.from_mask(self, self.mask(iterable))
+
+    def full(self):
+        """ The BitSet containing every element of the universe.
+        """
+        return BitSet.from_mask(self, (1 << len(self.elements)) - 1)
+
+
+class BitSet(Set):
+    """ A Set over a Universe, stored as a bitmask of element indices.
+    """
+
+    def __init__(self, universe, *items):
+        """ Create the set. Every item must be in the universe.
+        """
+        self.universe = universe
+        super().__init__(*items)
+
+    @classmethod
+    def from_mask(cls, universe, mask):
+        """ Create a new BitSet directly from a bitmask.
+        """
+        new = cls.__new__(cls)
+        new.universe = universe
+        new.mask = mask
+        return new
+
+    @classmethod
+    def from_set(cls, universe, original):
+        """ Create a new BitSet with the same elements as original.
+        """
+        return cls.from_mask(universe, universe.mask(original))
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """ Not available: a BitSet needs a Universe to draw from.
+        """
+        raise TypeError("A BitSet needs a Universe; use "
+                        "universe.bitset_from(iterable).")
+
+    @classmethod
+    def from_ackermann(cls, code):
+        """ Not available: a BitSet needs a Universe to draw from.
+        """
+        raise TypeError("A BitSet needs a Universe; use "
+                        "BitSet.from_set(universe, Set.from_ackermann(code)).")
+
+    def to_set(self):
+        """ Return a regular Set with the same elements.
+        """
+        return Set(*self)
+
+    @property
+    def items(self):
+        """ The elements as a frozenset, built on first use.
+        """
+        if self._items is None:
+            self._items = frozenset(self)
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self.mask = self.universe.mask(items)
+        self._items = frozenset(items)
+
+    @property
+    def mask(self):
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask):
+        self._mask = mask
+        self._items = None
+        self._hash = None
+
+    def __hash__(self):
+        """ Hash the same as a Set with the same elements.
+        """
+        if self._hash is None:
+            if self.universe._hashes_match:
+                parts = self.universe._hash_parts
+                xor = 0
+                for i in _bits(self.mask):
+                    xor ^= parts[i]
+                self._hash = _frozenset_hash(xor, len(self))
+            else:
+                self._hash = hash(self.items)
+        return self._hash
+
+    def __contains__(self, something):
+        """ Return whether the set contains something.
+        """
+        i = self.universe.index.get(something)
+        return i is not None and (self.mask >> i) & 1 == 1
+
+    def __len__(self):
+        """ Return the size of the set (number of elements).
+        """
+        return bin(self.mask).count("1")
+
+    def __eq__(self, other):
+        """ Sets are equal iff they have the same elements.
+        """
+        if isinstance(other, BitSet) and other.universe is self.universe:
+            return self.mask == other.mask
+        return super().__eq__(other)
+
+    def __iter__(self):
+        """ Iterate through the items, in universe index order.
+        """
+        elements = self.universe.elements
+        for i in _bits(self.mask):
+            yield elements[i]
+
+    def powerset(self):
+        """ Generate the powerset of self, as a Set of BitSets.
+        """
+        universe = self.universe
+        parts = universe._hash_parts
+        mask = self.mask
+        # Submasks in increasing order, so each one's hash and size follow
+        # from the submask without its lowest bit, which came earlier.
+        empty = BitSet.from_mask(universe, 0)
+        hashes = {0: (0, 0)}
+        subsets = [empty]
+        sub = (0 - mask) & mask
+        while sub:
+            low = sub & -sub
+            xor, size = hashes[sub ^ low]
+            xor ^= parts[low.bit_length() - 1]
+            hashes[sub] = (xor, size + 1)
+            new = BitSet.from_mask(universe, sub)
+            if universe._hashes_match:
+                new._hash = _frozenset_hash(xor, size + 1)
+            subsets.append(new)
+            sub = (sub - mask) & mask
+        return Set.from_iterable(subsets)
+
+    def delete(self, other_set):
+        """ Return a set with all the same elements as self,
+            except those in other_set.
+        """
+        other = self.universe.mask(other_set, strict=False)
+        return BitSet.from_mask(self.universe, self.mask & ~other)
+
+    def empty(self):
+        """ Return whether the set is empty.
+        """
+        return self.mask == 0
+
+    def union(self, *others):
+        """ Return the union of self with each of others. With no others,
+            this is the set union of the members, exactly as for Set.
+        """
+        if not others:
+            return super().union()
+        mask = self.mask
+        for other in others:
+            mask |= self.universe.mask(other)
+        return BitSet.from_mask(self.universe, mask)
+
+    def intersection(self, *others):
+        """ Return the intersection of self with each of others. With no
+            others, this is the set intersection of the members, exactly as
+            for Set.
+        """
+        if not others:
+            return super().intersection()
+        mask = self.mask
+        for other in others:
+            mask &= self.universe.mask(other, strict=False)
+        return BitSet.from_mask(self.universe, mask)
+
+    def subset(self, other, strict=False):
+        """ Return whether this is a subset of other.
+            If the strict flag is set, make sure they are not equal.
+        """
+        if not (isinstance(other, BitSet) and other.universe is self.universe):
+            return super().subset(other, strict)
+        result = self.mask & ~other.mask == 0
+        if not strict:
+            return result
+        else:
+            return result and self.mask != other.mask
+
+
+def _bits(mask):
+    """ The indices of the set bits of mask, lowest first.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+_HASH_BITS = _sys.hash_info.width
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+def _shuffle_hash(h):
+    """ Spread the bits of one element hash, as CPython's frozenset does.
+    """
+    h &= _HASH_MASK
+    return (((h ^ 89869747) ^ (h << 16)) * 3644798167) & _HASH_MASK
+
+
+def _frozenset_hash(xor, size):
+    """ The hash CPython gives a frozenset of size elements, whose shuffled
+        element hashes xor together to xor.
+    """
+    h = (xor ^ ((size + 1) * 1927868237)) & _HASH_MASK
+    h ^= (h >> 11) ^ (h >> 25)
+    h = (h * 69069 + 907133923) & _HASH_MASK
+    if h == _HASH_MASK:
+        h = 590923713
+    if h >> (_HASH_BITS - 1):
+        h -= 1 << _HASH_BITS
+    return h
+
+
+def _test_bitsets():
+    u = Universe(Set(), Set(Set()), Set(Set(Set())))
+    a = u.bitset(Set(), Set(Set()))
+    b = u.bitset(Set(Set()), Set(Set(Set())))
+    print(a, b, a.union(b), a.intersection(b), a.delete(b))
+    print(len(a), Set() in a, Set() in b, a.subset(u.full()))
+    print(a.powerset() == a.to_set().powerset())
+
+
+if __name__ == "__main__":
+    import cProfile
+    cProfile.run("_test_bitsets()")
+    # _test_bitsets()
@@ -0,0 +1,325 @@
+"""
+File: ZF.Expressions
+Author: Aaron Stockdill
+
+The goal of this module is not to be the most efficient representation, but
+to be the most true to the underlying mathematics.
+
+This file contains lazy arithmetic. Numbers lifted with lazy() combine into
+an expression graph rather than being computed straight away. Identical
+subexpressions are shared, simple identities are applied as the graph is
+built, and nothing is evaluated until the result is actually needed.
+"""
+
+import operator as _operator
+import weakref as _weakref
+
+# A little messy to sort out importing for the package or the file.
+try:
+    from .Sets import *
+    from .Numbers import *
+except SystemError:
+    from Sets import *
+    from Numbers import *
+
+
+_OPERATORS = {
+    "+": _operator.add,
+    "-": _operator.sub,
+    "*": _operator.mul,
+    "/": _operator.truediv,
+    "%": _operator.mod,
+}
+
+
+def lazy(value):
+    """ Lift a number (an Ordinal, Integer, Rational or int) into a lazy
+        Expression, so that arithmetic on it is deferred.
+    """
+    if isinstance(value, Expression):
+        return value
+    if not isinstance(value, (Set, int)):
+        raise TypeError("Only numbers can be made lazy.")
+    return Expression._node("value", (), value)
+
+
+class Expression(object):
+    """ A node in a lazy arithmetic expression graph.
+    """
+
+    # Every live node, keyed by its operation and the identities of its
+    # arguments, so building the same subexpression twice gives one node.
+    _nodes = _weakref.WeakValueDictionary()
+
+    def __init__(self, op, args, value=None):
+        self.op = op
+        self.args = args
+        self._value = value
+        if op == "value":
+            self.kind = None if isinstance(value, int) else type(value)
+        else:
+            self.kind = _result_kind(op, *args)
+
+    @classmethod
+    def _node(cls, op, args, value=None):
+        """ Find or create the node for op applied to args.
+        """
+        if op == "value" and isinstance(value, int):
+            # Tagged apart from the identity keys below, which are ints too.
+            key = ("int", type(value), value)
+        else:
+            key = (op, id(value)) + tuple(id(a) for a in args)
+        node = cls._nodes.get(key)
+        if node is None:
+            node = cls(op, args, value)
+            cls._nodes[key] = node
+        return node
+
+    def force(self):
+        """ Evaluate the expression, reusing any values already computed.
+        """
+        def children(node):
+            if node._value is None:
+                return node.args
+            return ()
+
+        def combine(node, values):
+            if node._value is None:
+                a, b = values
+                if isinstance(a, int):
+                    a = _number_like(a, b)
+                if isinstance(b, int):
+                    b = _number_like(b, a)
+                node._value = _OPERATORS[node.op](a, b)
+            return node._value
+
+        value = fold(self, combine, children)
+        if isinstance(value, int):
+            return Integer(value)
+        return value
+
+    def __repr__(self):
+        def combine(node, parts):
+            if node.op == "value":
+                return "lazy({})".format(node._value)
+            return "({} {} {})".format(parts[0], node.op, parts[1])
+
+        return fold(self, combine, lambda node: node.args)
+
+    def __str__(self):
+        return str(self.force())
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Expression):
+            other = other.force()
+        return self.force() == other
+
+    def __hash__(self):
+        return hash(self.force())
+
+    def __lt__(self, other):
+        return self.force() < _forced(other)
+    def __le__(self, other):
+        return self.force() <= _forced(other)
+    def __gt__(self, other):
+        return self.force() > _forced(other)
+    def __ge__(self, other):
+        return self.force() >= _forced(other)
+
+    def __iter__(self):
+        return iter(self.force())
+
+    def __len__(self):
+        return len(self.force())
+
+    def __contains__(self, something):
+        return something in self.force()
+
+    def __bool__(self):
+        return bool(self.force())
+
+    def __add__(a, b):
+        return _build("+", a, b)
+    def __radd__(b, a):
+        return _build("+", a, b)
+
+    def __sub__(a, b):
+        return _build("-", a, b)
+    def __rsub__(b, a):
+        return _build("-", a, b)
+
+    def __mul__(a, b):
+        return _build("*", a, b)
+    def __rmul__(b, a):
+        return _build("*", a, b)
+
+    def __truediv__(a, b):
+        return _build("/", a, b)
+    def __rtruediv__(b, a):
+        return _build("/", a, b)
+
+    def __mod__(a, b):
+        return _build("%", a, b)
+    def __rmod__(b, a):
+        return _build("%", a, b)
+
+
+def _build(op, a, b):
+    """ The simplest node equal to op applied to a and b.
+    """
+    try:
+        a, b = lazy(a), lazy(b)
+    except TypeError:
+        return NotImplemented
+    if op == "+":
+        if _is_constant(a, 0):
+            return b
+        if _is_constant(b, 0):
+            return a
+        if _is_int(a) and _is_int(b):
+            return lazy(a._value + b._value)
+        if (b.op == "-" and b.args[1] is a and _always_defined(b)
+                and _cannot_fail(a)):
+            # a + (x - a) = x
+            return b.args[0]
+        if (a.op == "-" and a.args[1] is b and _always_defined(a)
+                and _cannot_fail(b)):
+            # (x - b) + b = x
+            return a.args[0]
+        if _is_int(b) and a.op == "+" and _is_int(a.args[1]):
+            # (x + m) + n = x + (m + n)
+            return _build("+", a.args[0], a.args[1]._value + b._value)
+    elif op == "-":
+        if _is_constant(b, 0):
+            return a
+        if a is b and a.kind in _ZEROS and _cannot_fail(a):
+            return lazy(_ZEROS[a.kind]())
+        if a.op == "+" and a.args[1] is b and _cannot_fail(b):
+            # (x + b) - b = x
+            return a.args[0]
+        if a.op == "+" and a.args[0] is b and _cannot_fail(b):
+            # (b + x) - b = x
+            return a.args[1]
+    elif op == "*":
+        if _is_constant(a, 1):
+            return b
+        if _is_constant(b, 1):
+            return a
+        if _is_int(a) and _is_int(b):
+            return lazy(a._value * b._value)
+        kind = _result_kind(op, a, b)
+        if kind in _ZEROS and (_is_constant(a, 0) and _cannot_fail(b)
+                               or _is_constant(b, 0) and _cannot_fail(a)):
+            return lazy(_ZEROS[kind]())
+    elif op == "/":
+        if _is_constant(b, 1):
+            return a
+    return Expression._node(op, (a, b))
+
+
+# How to build zero for the kinds that are closed under +, - and *.
+_ZEROS = {
+    Ordinal: Ordinal,
+    Integer: Integer,
+}
+
+
+def _result_kind(op, a, b):
+    """ The class the result of op on a and b will have, if it is known.
+    """
+    if op == "/":
+        return None
+    kinds = {a.kind, b.kind} - {None}
+    if len(kinds) == 1:
+        kind, = kinds
+        if kind in _ZEROS:
+            return kind
+    return None
+
+
+def _always_defined(node):
+    """ Whether the subtraction node can never fail. Ordinal subtraction
+        fails when the result would be negative, so cancelling it away
+        would hide the error.
+    """
+    x, y = node.args
+    return node.kind is Integer or (_is_int(x) and _is_int(y))
+
+
+def _cannot_fail(node):
+    """ Whether forcing node can never raise, so it is safe to cancel it
+        away: it is built from numbers with + and *, and subtractions that
+        are always defined. Division and remainder may be by zero.
+    """
+    def children(n):
+        if n._value is None:
+            return n.args
+        return ()
+
+    for n in walk(node, children):
+        if n._value is not None:
+            if not isinstance(n._value, (int, Ordinal, Integer, Rational)):
+                return False
+        elif n.op in ("/", "%"):
+            return False
+        elif n.op == "-" and not _always_defined(n):
+            return False
+    return True
+
+
+def _is_int(node):
+    """ Whether node is a plain int constant.
+    """
+    return node.op == "value" and isinstance(node._value, int)
+
+
+def _is_constant(node, n):
+    """ Whether node is a constant equal to the small number n.
+    """
+    if node.op != "value":
+        return False
+    value = node._value
+    if isinstance(value, int):
+        return value == n
+    if isinstance(value, Ordinal):
+        return len(value) == n
+    if isinstance(value, Integer):
+        return value == Integer(n)
+    return False
+
+
+def _number_like(n, other):
+    """ Convert the int n to the same kind of number as other.
+    """
+    if isinstance(other, Ordinal):
+        return Ordinal(n)
+    return Integer(n)
+
+
+def _forced(value):
+    """ The value of an Expression, or the value itself otherwise.
+    """
+    if isinstance(value, Expression):
+        return value.force()
+    return value
+
+
+def _test_expressions():
+    a = lazy(Ordinal(3))
+    b = lazy(Ordinal(4))
+    e = (a*b + a) - a*b
+    print(repr(e), "=", e, e is a)
+    print(repr(a*b + 2 + 3), "=", a*b + 2 + 3)
+    print(repr(b - b), "=", b - b)
+    d = lazy(Ordinal(2)) - b
+    print(repr(d - d), repr(0 * d))
+    x = lazy(Integer(-4))
+    print(repr(x * 1 + 0), x * Integer(3) + 1)
+
+
+if __name__ == "__main__":
+    import cProfile
+    cProfile.run("_test_expressions()")
+    # _test_expressions()
@@ -54,9 +54,8 @@ class Ordinal(Set):
                 raise ValueError("Ordinals can only be "
                                  "created from positive ints.")
         elif isinstance(from_number, Integer):
-            sign, value = from_number
-            assert(sign == Integer.POSITIVE or value == ZERO)
-            self.items = value.items
+            assert(not from_number.is_negative())
+            self.items = from_number._ordinal().items
         elif isinstance(from_number, Set):
             self.items = from_number.items
 
@@ -71,13 +70,21 @@ class Ordinal(Set):
     def __lt__(self, other):
         """ Less than.
         """
+        if not isinstance(other, Ordinal):
+            return NotImplemented
         return self in other
 
     def __le__(self, other):
+        if not isinstance(other, Ordinal):
+            return NotImplemented
         return self == other or self < other
     def __gt__(self, other):
+        if not isinstance(other, Ordinal):
+            return NotImplemented
         return not (self <= other)
     def __ge__(self, other):
+        if not isinstance(other, Ordinal):
+            return NotImplemented
         return self == other or self > other
 
     def __str__(self):
@@ -93,33 +100,41 @@ class Ordinal(Set):
     def __add__(a, b):
         """ Add together two ordinals.
         """
-        if b == ZERO:
-            return a
-        else:
-            z = pred(b)
-            return succ(a + z)
+        if not isinstance(b, Ordinal):
+            return NotImplemented
+        result = a
+        while b != ZERO:
+            b = pred(b)
+            result = succ(result)
+        return result
 
     def __sub__(a, b):
         """ Subtract b from a.
         """
-        if b == ZERO:
-            return a
-        else:
-            z = pred(b)
-            return pred(a - z)
+        if not isinstance(b, Ordinal):
+            return NotImplemented
+        result = a
+        while b != ZERO:
+            b = pred(b)
+            result = pred(result)
+        return result
 
     def __mul__(a, b):
         """ Multiply two ordinals.
         """
-        if b == ZERO:
-            return ZERO
-        else:
-            z = pred(b)
-            return (a*z) + a
+        if not isinstance(b, Ordinal):
+            return NotImplemented
+        result = ZERO
+        while b != ZERO:
+            b = pred(b)
+            result = result + a
+        return result
 
     def __truediv__(a, b):
         """ Divide a by b.
         """
+        if not isinstance(b, Ordinal):
+            return NotImplemented
         if b == ZERO:
             raise ZeroDivisionError
         q = ZERO
@@ -133,6 +148,8 @@ class Ordinal(Set):
             return Rational(a, b)
 
     def __mod__(a, b):
+        if not isinstance(b, Ordinal):
+            return NotImplemented
         if b == ZERO:
             raise ZeroDivisionError
         r = a
@@ -170,218 +187,376 @@ class Integer(Pair):
     POSITIVE = Set(Set(Set(Set())), Set(Set()))
     NEGATIVE = Set(Set(Set(Set(Set()))), Set(Set()))
 
+    # Arithmetic runs on the sign and magnitude; the ordinal and the pair
+    # of sets are only built when something asks to see them.
+    _number = None
+    _items = None
+
     def __init__(self, value=0):
-        """ Initialize the Integer, possibly from an int value.
+        """ Initialize the Integer from an int, Integer, Ordinal or sign Pair.
         """
-        sign = Integer.POSITIVE
-        if isinstance(value, Ordinal):
+        number = None
+        if isinstance(value, Integer):
+            negative, magnitude = value._negative, value._magnitude
+            number = value._number
+        elif isinstance(value, Ordinal):
+            negative, magnitude = False, len(value)
             number = value
-        elif isinstance(value, Integer):
-            sign, number = value
         elif isinstance(value, Pair):
             sign, number = value
             assert(sign == Integer.POSITIVE or sign == Integer.NEGATIVE)
             assert(isinstance(number, Ordinal))
+            negative, magnitude = sign == Integer.NEGATIVE, len(number)
+        elif isinstance(value, int):
+            negative, magnitude = value < 0, abs(value)
+        else:
+            raise TypeError("Cannot make an Integer from {}.".format(
+                type(value).__name__))
+        # There is only one zero, and it is positive.
+        self._negative = negative and magnitude != 0
+        self._magnitude = magnitude
+        self._number = number
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """ Not available: Integers are built from their sign and magnitude.
+        """
+        raise TypeError("Integers are not built from raw members; use "
+                        "Integer(Pair(sign, ordinal)).")
+
+    @classmethod
+    def from_ackermann(cls, code):
+        """ Not available: Integers are built from their sign and magnitude.
+        """
+        raise TypeError("Integers are not built from raw members; use "
+                        "Integer(Pair(sign, ordinal)).")
+
+    @property
+    def items(self):
+        """ The Kuratowski pair of sign and ordinal, built on first use.
+        """
+        if self._items is None:
+            sign, number = self
+            self._items = Pair(sign, number).items
+        return self._items
+
+    def _ordinal(self):
+        """ The magnitude as an Ordinal.
+        """
+        if self._number is None:
+            self._number = Ordinal(self._magnitude)
+        return self._number
+
+    def _value(self):
+        """ The integer as a Python int.
+        """
+        if self._negative:
+            return -self._magnitude
+        return self._magnitude
+
+    def __iter__(self):
+        """ Extract the sign and the ordinal.
+        """
+        if self._negative:
+            yield Integer.NEGATIVE
         else:
-            number = Ordinal(abs(value))
-            if value < 0:
-                sign = Integer.NEGATIVE
-        super().__init__(sign, number)
+            yield Integer.POSITIVE
+        yield self._ordinal()
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __eq__(self, other):
+        if isinstance(other, Integer):
+            return (self._negative == other._negative
+                    and self._magnitude == other._magnitude)
+        return super().__eq__(other)
 
     def __str__(self):
         """ Slightly more typical display.
         """
-        sign, number = self
-        output = str(number)
-        if sign == Integer.NEGATIVE and number != ZERO:
-            output = "-" + output
-        return output
+        return str(self._value())
 
     def __lt__(self, other):
-        """ Less than.
+        """ Less than. Like equality, only other Integers compare; the
+            reflected Rational methods handle Rationals.
         """
-        self_sign, self_val = self
-        other_sign, other_val = other
-        if self_sign == other_sign == Integer.POSITIVE:
-            return self_val < other_val
-        elif self_sign == other_sign == Integer.NEGATIVE:
-            return other_val < self_val
-        elif self_sign == Integer.POSITIVE:
-            return False
-        else:
-            return True
+        if not isinstance(other, Integer):
+            return NotImplemented
+        return self._value() < other._value()
 
     def __le__(self, other):
-        return self == other or self < other
+        if not isinstance(other, Integer):
+            return NotImplemented
+        return self._value() <= other._value()
     def __gt__(self, other):
-        return not (self <= other)
+        if not isinstance(other, Integer):
+            return NotImplemented
+        return self._value() > other._value()
     def __ge__(self, other):
-        return self == other or self > other
+        if not isinstance(other, Integer):
+            return NotImplemented
+        return self._value() >= other._value()
 
     def __add__(a, b):
-        signa, vala = a
-        signb, valb = b
-        if signa == signb == Integer.POSITIVE:
-            pair = Pair(Integer.POSITIVE, vala + valb)
-            pair.__class__ = self.__class__
-            return pair
-        elif signa == signb == Integer.NEGATIVE:
-            return Integer(Pair(Integer.NEGATIVE, vala + valb))
-        elif signa == Integer.POSITIVE and signb == Integer.NEGATIVE:
-            if valb >= vala:
-                sign = Integer.NEGATIVE
-                value = valb - vala
-            else:
-                sign = Integer.POSITIVE
-                value = vala - valb
-            return Integer(Pair(sign, value))
-        else:
-            if vala >= valb:
-                sign = Integer.NEGATIVE
-                value = vala - valb
-            else:
-                sign = Integer.POSITIVE
-                value = valb - vala
-            return Integer(Pair(sign, value))
+        b = _integer_value(b)
+        if b is None:
+            return NotImplemented
+        return Integer(a._value() + b)
+
+    def __radd__(b, a):
+        return b + a
 
     def __sub__(a, b):
-        return a + b.negative()
+        b = _integer_value(b)
+        if b is None:
+            return NotImplemented
+        return Integer(a._value() - b)
+
+    def __rsub__(b, a):
+        return b.negative() + a
 
     def __mul__(a, b):
-        signa, vala = a
-        signb, valb = b
-        if signa == signb:
-            sign = Integer.POSITIVE
-        else:
-            sign = Integer.NEGATIVE
-        return Integer(Pair(sign, vala * valb))
+        b = _integer_value(b)
+        if b is None:
+            return NotImplemented
+        return Integer(a._value() * b)
+
+    def __rmul__(b, a):
+        return b * a
 
     def __truediv__(a, b):
-        signa, vala = a
-        signb, valb = b
-        if signa == signb:
-            sign = Integer.POSITIVE
-        else:
-            sign = Integer.NEGATIVE
-        number = vala / valb
-        if isinstance(number, Rational):
-            num, denom = number
-            if sign == Integer.NEGATIVE:
-                return Rational(num.negative(), denom)
-            else:
-                return number
-        else:
-            return Integer(Pair(sign, number))
+        b = _integer_value(b)
+        if b is None:
+            return NotImplemented
+        if b == 0:
+            raise ZeroDivisionError
+        if a._value() % b == 0:
+            return Integer(a._value() // b)
+        return Rational(a._value(), b)
+
+    def __rtruediv__(b, a):
+        return b.inverse() * a
 
     def __mod__(a, b):
-        b_sign, b_val = Integer(b)
-        if b_sign == Integer.NEGATIVE:
+        b = _integer_value(b)
+        if b is None:
+            return NotImplemented
+        if b < 0:
             raise ValueError("Cannot mod by a negative number.")
-        else:
-            sign, value = a
-            if sign == Integer.NEGATIVE:
-                return Integer(b - Integer(value % b_val))
-            else:
-                return Integer(value % b_val)
+        if b == 0:
+            raise ZeroDivisionError
+        return Integer(a._value() % b)
+
+    def __rmod__(b, a):
+        a = _integer_value(a)
+        if a is None:
+            return NotImplemented
+        return Integer(a) % b
 
     def inverse(self):
         """ Return the inverse of the integer (the reciprocal).
         """
-        sign, val = self
-        num = Integer(Pair(sign, succ(ZERO)))
-        return Rational(num, val)
+        return Rational(-1 if self._negative else 1, self._magnitude)
 
     def negative(self):
         """ Return the negative of the integer.
         """
-        sign, value = self
-        new_sign = Integer.NEGATIVE
-        if sign == Integer.NEGATIVE or value == ZERO:
-            new_sign = Integer.POSITIVE
-        return Integer(Pair(new_sign, value))
+        return Integer(-self._value())
 
     def is_negative(self):
         """ Returns whether the integer is negative.
         """
-        sign, val = self
-        if sign == Integer.NEGATIVE and val != 0:
-            return True
-        return False
+        return self._negative
 
 
 class Rational(Pair):
     """ A quotient class, based on ordered pairs.
     """
 
+    # As for Integer, the pair of sets is only built on first use.
+    _items = None
+
     def __init__(self, numerator, denominator):
         """ Numerator and denominator must be able to be Integers.
         """
-        numerator = Integer(numerator)
-        denominator = Integer(denominator)
-        gcd = self._gcd(numerator, denominator)
-        a = numerator / gcd
-        b = denominator / gcd
-        if b == succ(ZERO):
+        a = Integer(numerator)._value()
+        b = Integer(denominator)._value()
+        if b == 0:
+            raise ZeroDivisionError
+        if b < 0:
+            a, b = -a, -b
+        gcd = self._gcd(a, b)
+        a //= gcd
+        b //= gcd
+        if b == 1:
             self.__class__ = Integer
             self.__init__(a)
         else:
-            super().__init__(a, b)
+            self._numerator = a
+            self._denominator = b
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """ Not available: Rationals are built from their numerator and
+            denominator.
+        """
+        raise TypeError("Rationals are not built from raw members; use "
+                        "Rational(numerator, denominator).")
+
+    @classmethod
+    def from_ackermann(cls, code):
+        """ Not available: Rationals are built from their numerator and
+            denominator.
+        """
+        raise TypeError("Rationals are not built from raw members; use "
+                        "Rational(numerator, denominator).")
+
+    @property
+    def items(self):
+        """ The Kuratowski pair of numerator and denominator, built on
+            first use.
+        """
+        if self._items is None:
+            num, denom = self
+            self._items = Pair(num, denom).items
+        return self._items
+
+    def __iter__(self):
+        """ Extract the numerator and denominator.
+        """
+        yield Integer(self._numerator)
+        yield Integer(self._denominator)
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __eq__(self, other):
+        if isinstance(other, Rational):
+            return (self._numerator == other._numerator
+                    and self._denominator == other._denominator)
+        return super().__eq__(other)
 
     def __str__(self):
-        a, b = self
-        return str(a) + "/" + str(b)
+        return "{}/{}".format(self._numerator, self._denominator)
+
+    def __lt__(self, other):
+        """ Less than. Only Rationals and Integers compare, as only they
+            can be equal.
+        """
+        if not isinstance(other, (Rational, Integer)):
+            return NotImplemented
+        numb, denb = _rational_value(other)
+        return self._numerator * denb < numb * self._denominator
+
+    def __le__(self, other):
+        if not isinstance(other, (Rational, Integer)):
+            return NotImplemented
+        return self == other or self < other
+    def __gt__(self, other):
+        if not isinstance(other, (Rational, Integer)):
+            return NotImplemented
+        other = _rational_value(other)
+        numb, denb = other
+        return self._numerator * denb > numb * self._denominator
+    def __ge__(self, other):
+        if not isinstance(other, (Rational, Integer)):
+            return NotImplemented
+        return self == other or self > other
 
     def __add__(a, b):
-        numa, dena = a
+        b = _rational_value(b)
+        if b is None:
+            return NotImplemented
         numb, denb = b
-        new_num = (numa * denb) + (numb * dena)
-        new_denom = dena * denb
+        new_num = (a._numerator * denb) + (numb * a._denominator)
+        new_denom = a._denominator * denb
         return Rational(new_num, new_denom)
 
+    def __radd__(b, a):
+        return b + a
+
     def __sub__(a, b):
-        numa, dena = a
+        b = _rational_value(b)
+        if b is None:
+            return NotImplemented
         numb, denb = b
-        new_num = (numa * denb) - (numb * dena)
-        new_denom = dena * denb
+        new_num = (a._numerator * denb) - (numb * a._denominator)
+        new_denom = a._denominator * denb
         return Rational(new_num, new_denom)
 
+    def __rsub__(b, a):
+        return b.negative() + a
+
     def __mul__(a, b):
-        numa, dena = a
+        b = _rational_value(b)
+        if b is None:
+            return NotImplemented
         numb, denb = b
-        new_num = numa * numb
-        new_denom = dena * denb
+        new_num = a._numerator * numb
+        new_denom = a._denominator * denb
         return Rational(new_num, new_denom)
 
+    def __rmul__(b, a):
+        return b * a
+
     def __truediv__(a, b):
-        return a * b.inverse()
+        b = _rational_value(b)
+        if b is None:
+            return NotImplemented
+        numb, denb = b
+        return Rational(a._numerator * denb, a._denominator * numb)
+
+    def __rtruediv__(b, a):
+        return b.inverse() * a
 
     def _gcd(self, a, b):
-        """ Calculate the greatest common divisor of two Ordinals.
+        """ Calculate the greatest common divisor of two ints.
         """
-        if b == Integer(ZERO) or b == ZERO:
-            return a
-        else:
-            r = a % b
-            return self._gcd(b, r)
+        while b != 0:
+            a, b = b, a % b
+        return abs(a)
 
     def inverse(self):
         """ Return the multiplicative inverse (i.e. the reciprocal)
             of the quotient.
         """
-        a, b = self
-        return Rational(b, a)
+        return Rational(self._denominator, self._numerator)
 
     def negative(self):
         """ Return the negative of the integer.
         """
-        num, denom = self
-        return Rational(num.negative(), denom)
+        return Rational(-self._numerator, self._denominator)
 
     def is_negative(self):
         """ Returns whether the integer is negative.
         """
-        num, _ = self
-        return num.is_negative()
+        return self._numerator < 0
+
+
+def _integer_value(number):
+    """ The Python int value of an Integer, Ordinal or int, or None if it
+        is some other kind of number.
+    """
+    if isinstance(number, Integer):
+        return number._value()
+    if isinstance(number, Ordinal):
+        return len(number)
+    if isinstance(number, int):
+        return number
+    return None
+
+
+def _rational_value(number):
+    """ The numerator and denominator of a Rational, Integer, Ordinal or
+        int, or None if it is some other kind of number.
+    """
+    if isinstance(number, Rational):
+        return number._numerator, number._denominator
+    value = _integer_value(number)
+    if value is None:
+        return None
+    return value, 1
 
 
 ZERO = Ordinal()
@@ -415,6 +590,7 @@ def _test_ord():
     print("-4 * 3 =", neg_four * three)
     print("3 / -4 =", three / neg_four)
     print("-7 % 3 =", Integer(-7) % three)
+    print("2 - 3 =", 2 - three, " 2 / 3 =", Ordinal(2) / three)
 
     print("13 =", repr(Ordinal(13)))
 
@@ -9,6 +9,8 @@ This file contains the implementation of the Set, and some surrounding useful
 functions.
 """
 
+import sys as _sys
+
 
 def powerset(original):
     """ Return the powerset of the original set.
@@ -23,23 +25,222 @@ P = powerset # Useful alias
 def union(a, b):
     """ Return the union of a and b.
     """
+    if _same_universe(a, b):
+        return a.union(b)
     return Set(a, b).union()
 
 def intersection(a, b):
     """ Return the intersection of a and b.
     """
+    if _same_universe(a, b):
+        return a.intersection(b)
     return Set(a, b).intersection()
 
+def _same_universe(a, b):
+    """ Whether a and b are BitSets over the one Universe, so they can be
+        combined a word at a time.
+    """
+    universe = getattr(a, 'universe', None)
+    return universe is not None and getattr(b, 'universe', None) is universe
+
+
+def walk(root, children=None, order="pre", key=id):
+    """ Yield root and everything reachable from it through children, using
+        an explicit stack rather than recursion. In "pre" order a node comes
+        before its children, in "post" order after them. Nodes with the same
+        key are only visited once; a key of None visits every occurrence.
+    """
+    if children is None:
+        children = _members
+    if order not in ("pre", "post"):
+        raise ValueError("Order must be 'pre' or 'post'.")
+    seen = set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+            continue
+        if key is not None:
+            k = key(node)
+            if k in seen:
+                continue
+            seen.add(k)
+        if order == "pre":
+            yield node
+        else:
+            stack.append((node, True))
+        stack.extend((c, False) for c in reversed(list(children(node))))
+
+
+def fold(root, combine, children=None, key=id, cycle=None):
+    """ Compute combine(node, results) bottom-up over everything reachable
+        from root, where results holds the values already computed for the
+        children of node. Each key is combined only once, so shared
+        subterms are reused. Returns the value for root. Unlike walk, a
+        key is required, as results are looked up by it; a key of None is
+        a ValueError. A child that is still being folded (a cycle) gets the
+        value cycle, or is a ValueError if cycle is None.
+    """
+    if key is None:
+        raise ValueError("fold needs a key to look up results by.")
+    if children is None:
+        children = _members
+    results = {}
+    active = set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        k = key(node)
+        if expanded:
+            values = []
+            for c in children(node):
+                c_key = key(c)
+                if c_key in active:
+                    if cycle is None:
+                        raise ValueError("fold cannot follow a cycle.")
+                    values.append(cycle)
+                else:
+                    values.append(results[c_key])
+            active.discard(k)
+            results[k] = combine(node, values)
+            continue
+        if k in results or k in active:
+            continue
+        active.add(k)
+        stack.append((node, True))
+        stack.extend((c, False) for c in reversed(list(children(node))))
+    return results[key(root)]
+
+
+def _members(node):
+    """ The elements of node if it is a Set, otherwise nothing.
+    """
+    if isinstance(node, Set):
+        return node.items
+    return ()
+
+
+def memory_report(obj):
+    """ Account for the memory held by obj and everything inside it,
+        counting each distinct object once however often it is shared.
+        Only what is actually stored is followed: instance attributes
+        (including caches) and the contents of containers. Lazily built
+        views are not forced into existence, and interpreter singletons
+        such as None are left out. A reference back into an object still
+        being measured counts as one shared node.
+    """
+    report = MemoryReport()
+
+    def visit(node, tree_sizes):
+        size = _sys.getsizeof(node)
+        if _has_instance_dict(node):
+            size += _sys.getsizeof(node.__dict__)
+        name = type(node).__name__
+        report.bytes_by_class[name] = report.bytes_by_class.get(name, 0) + size
+        report.total_bytes += size
+        report.nodes += 1
+        return 1 + sum(tree_sizes)
+
+    report.tree_nodes = fold(obj, visit, _stored, cycle=1)
+    return report
+
+
+def _stored(node):
+    """ The objects node holds a reference to, without calling anything
+        that might compute them.
+    """
+    if isinstance(node, (tuple, list, frozenset, set)):
+        held = node
+    elif isinstance(node, dict):
+        held = list(node.keys()) + list(node.values())
+    elif _has_instance_dict(node):
+        held = node.__dict__.values()
+    else:
+        return ()
+    return [h for h in held if not _is_singleton(h)]
+
+
+def _is_singleton(node):
+    """ Whether node is one of the interpreter's shared constants, which
+        belong to no particular structure.
+    """
+    return (node is None or node is True or node is False
+            or node is Ellipsis or node is NotImplemented)
+
+
+def _has_instance_dict(node):
+    """ Whether node is an instance with its own attribute dict.
+    """
+    return (hasattr(node, '__dict__') and not isinstance(node, type)
+            and not isinstance(node, type(_sys)))
+
+
+class MemoryReport(object):
+    """ The result of memory_report: distinct nodes and the bytes they hold.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.tree_nodes = 0
+        self.total_bytes = 0
+        self.bytes_by_class = {}
+
+    @property
+    def sharing_ratio(self):
+        """ How many nodes a naive recursive count would see for each
+            distinct node actually in memory.
+        """
+        if self.nodes == 0:
+            return 1.0
+        return self.tree_nodes / self.nodes
+
+    def __str__(self):
+        lines = [
+            "{} distinct nodes, {} bytes".format(self.nodes, self.total_bytes),
+            "sharing ratio {:.3g} ({} nodes as a tree)".format(
+                self.sharing_ratio, self.tree_nodes),
+        ]
+        for name, size in sorted(self.bytes_by_class.items(),
+                                 key=lambda kv: -kv[1]):
+            lines.append("  {}: {} bytes".format(name, size))
+        return "\n".join(lines)
+
+
+def _ackermann_members(code):
+    """ The codes of the elements of the set with the given Ackermann code.
+    """
+    members = []
+    while code:
+        low = code & -code
+        members.append(low.bit_length() - 1)
+        code ^= low
+    return members
+
 
 class Set(object):
     """ The primitive Set class.
     """
 
+    # The Ackermann code is cached alongside the items it was computed from,
+    # so a subclass that swaps out self.items never sees a stale code.
+    _ackermann = None
+
     def __init__(self, *items):
         """ Create the set.
         """
         self.items = frozenset(items)
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """ Create a new set straight from an iterable (a generator, say),
+            without first unpacking it into arguments.
+        """
+        new = Set()
+        new.items = frozenset(iterable)
+        new.__class__ = cls
+        return new
+
     def __hash__(self):
         """ Required for Python 'set' hashing.
         """
@@ -48,16 +249,34 @@ class Set(object):
     def __repr__(self):
         """ How the set is internally represented.
         """
-        if len(self.items) == 0:
-            return "{}"
-        return "{" + ", ".join(repr(i) for i in self.items) + "}"
+        def expand(node):
+            return node is self or (isinstance(node, Set)
+                                    and type(node).__repr__ is Set.__repr__)
+
+        def combine(node, parts):
+            if not expand(node):
+                return repr(node)
+            return "{" + ", ".join(parts) + "}"
+
+        return fold(self, combine,
+                    lambda node: node.items if expand(node) else ())
 
     def __str__(self):
         """ A prettier view of the set for printing.
         """
-        if len(self.items) == 0:
-            return "∅"
-        return "{" + ", ".join(str(i) for i in self.items) + "}"
+        def expand(node):
+            return node is self or (isinstance(node, Set)
+                                    and type(node).__str__ is Set.__str__)
+
+        def combine(node, parts):
+            if not expand(node):
+                return str(node)
+            if len(parts) == 0:
+                return "∅"
+            return "{" + ", ".join(parts) + "}"
+
+        return fold(self, combine,
+                    lambda node: node.items if expand(node) else ())
 
     def __contains__(self, something):
         """ Return whether the set contains something.
@@ -84,7 +303,10 @@ class Set(object):
         """ Sets are equal iff they have the same elements.
         """
         if not isinstance(other, Set):
-            return False
+            return NotImplemented
+        a, b = self._known_ackermann(), other._known_ackermann()
+        if a is not None and b is not None:
+            return a == b
         return (self.subset(other, strict=False)
             and other.subset(self, strict=False))
 
@@ -102,16 +324,10 @@ class Set(object):
     def powerset(self):
         """ Generate the powerset of self.
         """
-        if self.empty():
-            return Set(Set())
-        else:
-            item = self.take()
-            new_set = self.delete(Set(item))
-            sub_powerset = new_set._powerset()
-            result = sub_powerset.items.union({
-                Set(a, Set(item)).union() for a in sub_powerset
-            })
-            return Set(*result)
+        subsets = [Set()]
+        for item in self.items:
+            subsets.extend([Set(a, Set(item)).union() for a in subsets])
+        return Set(*subsets)
 
 
     def delete(self, other_set):
@@ -126,7 +342,9 @@ class Set(object):
         return len(self.items) == 0
 
     def union(self):
-        """ Return the set union.
+        """ Return the set union: the elements of the members of self.
+            BitSet.union also accepts other sets, and given any it is
+            instead the binary union of self with them.
         """
         all_items = set()
         for subset in self.items:
@@ -135,7 +353,10 @@ class Set(object):
         return Set(*all_items)
 
     def intersection(self):
-        """ Return the set intersection.
+        """ Return the set intersection: the elements common to every
+            member of self. BitSet.intersection also accepts other sets,
+            and given any it is instead the binary intersection of self
+            with them.
         """
         intersection = set()
         union = self.union()
@@ -163,6 +384,68 @@ class Set(object):
         """
         return other.subset(self, strict)
 
+    def where(self, predicate):
+        """ The subset of elements satisfying predicate (separation), as a
+            lazy view.
+        """
+        return Separation(self, predicate)
+
+    def map(self, function):
+        """ The image of the set under function (replacement), as a lazy
+            view.
+        """
+        return Replacement(self, function)
+
+    def to_ackermann(self):
+        """ Return the Ackermann code of the set: the natural number whose
+            binary digits are set exactly at the codes of its elements.
+            Only hereditarily finite sets (Sets all the way down) have one.
+            Codes grow as towers of two, so this is only practical for
+            shallow sets: the code of Ordinal(5) already has 2060 bits.
+        """
+        def children(node):
+            if isinstance(node, Set) and node._known_ackermann() is None:
+                return node.items
+            return ()
+
+        def combine(node, codes):
+            if not isinstance(node, Set):
+                raise TypeError("Only hereditarily finite Sets "
+                                "have an Ackermann code.")
+            code = node._known_ackermann()
+            if code is None:
+                code = 0
+                for c in codes:
+                    code |= 1 << c
+                node._ackermann = (node.items, code)
+            return code
+
+        return fold(self, combine, children)
+
+    @classmethod
+    def from_ackermann(cls, code):
+        """ Create the hereditarily finite set with the given Ackermann code.
+        """
+        if not isinstance(code, int) or code < 0:
+            raise ValueError("Ackermann codes are non-negative ints.")
+
+        def combine(n, members):
+            new = Set(*members)
+            new._ackermann = (new.items, n)
+            return new
+
+        new = fold(code, combine, _ackermann_members, key=int)
+        new.__class__ = cls
+        return new
+
+    def _known_ackermann(self):
+        """ The cached Ackermann code, or None if it is not yet known.
+        """
+        cache = self._ackermann
+        if cache is not None and cache[0] is self.items:
+            return cache[1]
+        return None
+
     def take(self, number=1):
         """ Take random elements from the set, up to number of them.
         """
@@ -177,6 +460,93 @@ class Set(object):
         return result
 
 
+class SetView(object):
+    """ A set described by a rule over a source, which is only built when
+        materialize is called. Views can be iterated and tested for
+        membership without building anything.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+    def __str__(self):
+        return str(self.materialize())
+
+    def __eq__(self, other):
+        """ A view equals whatever its Set would equal.
+        """
+        if isinstance(other, SetView):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self):
+        return hash(self.materialize())
+
+    def __len__(self):
+        """ Return the size of the set (number of elements).
+        """
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        """ Python Truthiness, based on whether the set would be empty.
+        """
+        for _ in self:
+            return True
+        return False
+
+    def where(self, predicate):
+        return Separation(self, predicate)
+
+    def map(self, function):
+        return Replacement(self, function)
+
+    def materialize(self):
+        """ Build the Set this view describes.
+        """
+        return Set.from_iterable(self)
+
+
+class Separation(SetView):
+    """ The set {x ∈ source | predicate(x)}.
+    """
+
+    def __init__(self, source, predicate):
+        super().__init__(source)
+        self.predicate = predicate
+
+    def __iter__(self):
+        for item in self.source:
+            if self.predicate(item):
+                yield item
+
+    def __contains__(self, something):
+        return something in self.source and self.predicate(something)
+
+
+class Replacement(SetView):
+    """ The set {function(x) | x ∈ source}.
+    """
+
+    def __init__(self, source, function):
+        super().__init__(source)
+        self.function = function
+
+    def __iter__(self):
+        # Different elements of the source may share an image.
+        seen = set()
+        for item in self.source:
+            image = self.function(item)
+            if image not in seen:
+                seen.add(image)
+                yield image
+
+    def __contains__(self, something):
+        return any(self.function(item) == something for item in self.source)
+
+
 def _test_sets():
     print(Set())
     un = Set(Set(), Set(Set()))
@@ -187,6 +557,12 @@ def _test_sets():
     a = Set('a', 'b', 'c')
     b = Set('c', 'd', 'e')
     print(a, b, intersection(a, b))
+    print(un.to_ackermann(), Set.from_ackermann(un.to_ackermann()) == un)
+    print(memory_report(powerset(un)))
+    p = powerset(un)
+    print(p.where(lambda x: len(x) == 1), Set() in p.map(lambda x: x.union()))
+    print(p.where(lambda x: True) == p, p == p.map(lambda x: x))
+    print(Set.from_iterable(Set(x) for x in un))
 
 
 if __name__ == "__main__":
@@ -41,11 +41,104 @@ class String(List):
     """ A string is a list of Characters.
     """
 
-    def __init__(self, string):
+    # The decoded text is cached alongside the items it was decoded from,
+    # as list concatenation builds Strings without going through __init__.
+    _text = None
+
+    def __init__(self, string=""):
+        if isinstance(string, String):
+            string = str(string)
         super().__init__(*[Character(s) for s in string])
+        if isinstance(string, str):
+            self._text = (self.items, string)
 
     def __str__(self):
-        return "".join(str(s) for s in self)
+        cache = self._text
+        if cache is None or cache[0] is not self.items:
+            cache = (self.items, "".join(str(s) for s in self))
+            self._text = cache
+        return cache[1]
+
+    def __len__(self):
+        """ The number of Characters in the string.
+        """
+        return len(str(self))
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __eq__(self, other):
+        """ Strings are equal iff they have the same Characters.
+        """
+        if isinstance(other, String):
+            return str(self) == str(other)
+        return super().__eq__(other)
+
+    def __lt__(self, other):
+        """ Lexicographic ordering.
+        """
+        if not isinstance(other, String):
+            return NotImplemented
+        return str(self) < str(other)
+
+    def __le__(self, other):
+        if not isinstance(other, String):
+            return NotImplemented
+        return str(self) <= str(other)
+    def __gt__(self, other):
+        if not isinstance(other, String):
+            return NotImplemented
+        return str(self) > str(other)
+    def __ge__(self, other):
+        if not isinstance(other, String):
+            return NotImplemented
+        return str(self) >= str(other)
+
+    def __contains__(self, something):
+        """ Substring search for Strings, set membership otherwise. A
+            Python str is a TypeError, as in the other String methods.
+        """
+        if isinstance(something, (String, str)):
+            return _text_of(something) in str(self)
+        return super().__contains__(something)
+
+    def __getitem__(self, index):
+        """ A Character for an index, a String for a slice.
+        """
+        if isinstance(index, slice):
+            return String(str(self)[index])
+        return Character(str(self)[index])
+
+    def find(self, sub, start=0, end=None):
+        """ Return the lowest index of sub within the string, or -1.
+        """
+        return str(self).find(_text_of(sub), start, end)
+
+    def startswith(self, prefix):
+        """ Return whether the string starts with prefix.
+        """
+        return str(self).startswith(_text_of(prefix))
+
+    def endswith(self, suffix):
+        """ Return whether the string ends with suffix.
+        """
+        return str(self).endswith(_text_of(suffix))
+
+    def split(self, sep=None, maxsplit=-1):
+        """ Return a List of the Strings separated by sep.
+        """
+        if sep is not None:
+            sep = _text_of(sep)
+        return List(*[String(s) for s in str(self).split(sep, maxsplit)])
+
+
+def _text_of(value):
+    """ The Python text of a String. Python strs are not accepted, just as
+        they never compare equal to a String.
+    """
+    if isinstance(value, String):
+        return str(value)
+    raise TypeError("Expected a String, not {}.".format(type(value).__name__))
 
 
 def _test_strings():
@@ -53,6 +146,8 @@ def _test_strings():
     s = String('Hello, I am a set.')
     print(s)
     print(String("Se") + String("ts"))
+    print(s[7:11], s.find(String("am")), String("set") in s, s.split(String(" ")))
+    print(String("Se") + String("ts") == String("Sets"), s < String("Sets"))
 
 
 if __name__ == "__main__":
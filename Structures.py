@@ -101,29 +101,25 @@ class List(Pair):
     def __iter__(self):
         """ Make sure the list can be iterated over.
         """
-        if super().__len__() == 0:
-            return
-        try:
-            current, next_link = super().__iter__()
-        except ValueError:
-            # Last singleton.
-            current, = super().__iter__()
-            yield current
-        else:
+        link = self
+        while isinstance(link, List):
+            if Set.__len__(link) == 0:
+                return
+            try:
+                current, link = Pair.__iter__(link)
+            except ValueError:
+                # Last singleton.
+                current, = Pair.__iter__(link)
+                yield current
+                return
             yield current
-            for item in next_link:
-                yield item
+        for item in link:
+            yield item
 
     def __len__(self):
         """ Make len return the length of the list.
         """
-        l = super().__len__()
-        if l == 0:
-            return 0
-        elif l == 1:
-            return 1
-        _, next = super().__iter__()
-        return 1 + len(next)
+        return sum(1 for _ in self)
 
 
     def __add__(a, b):
@@ -131,14 +127,10 @@ class List(Pair):
         """
         if super().__len__() == 0:
             return b
-        try:
-            a1, a2 = super().__iter__()
-            tail = a2 + b
-        except ValueError:
-            a1, = super().__iter__()
-            tail = b
-        result = Pair(a1, tail)
-        result.__class__ = a.__class__
+        result = b
+        for item in reversed(list(a)):
+            result = Pair(item, result)
+            result.__class__ = a.__class__
         return result
 
 
@@ -0,0 +1,221 @@
+"""
+File: ZF.Tracing
+Author: Aaron Stockdill
+
+The goal of this module is not to be the most efficient representation, but
+to be the most true to the underlying mathematics.
+
+This file contains opt-in tracing of the expensive operations. While tracing
+is enabled, each traced call is recorded as a span (with its nesting depth)
+in a fixed-size ring buffer. The spans can be summarised as per-operation
+latency histograms, or exported as Chrome trace-event JSON for viewing in
+chrome://tracing or Perfetto. When tracing is disabled the operations are
+left exactly as they were, and cost nothing extra.
+"""
+
+import collections as _collections
+import contextlib as _contextlib
+import functools as _functools
+import json as _json
+import os as _os
+import threading as _threading
+import time as _time
+
+# A little messy to sort out importing for the package or the file.
+try:
+    from .Sets import *
+    from .BitSets import *
+    from .Structures import *
+    from .Numbers import *
+    from .Strings import *
+except SystemError:
+    from Sets import *
+    from BitSets import *
+    from Structures import *
+    from Numbers import *
+    from Strings import *
+
+
+_ARITHMETIC = ("__add__", "__sub__", "__mul__", "__truediv__", "__mod__")
+
+# The operations that are traced, by the class that defines them.
+TRACE_POINTS = (
+    (Set, ("__init__", "powerset", "union", "intersection")),
+    (BitSet, ("powerset", "union", "intersection")),
+    (Ordinal, ("_succ", "_pred") + _ARITHMETIC),
+    (Integer, _ARITHMETIC),
+    (Rational, _ARITHMETIC),
+    (List, ("__init__", "__str__")),
+    (String, ("__init__", "__str__")),
+)
+
+_originals = {}
+_events = _collections.deque(maxlen=0)
+_local = _threading.local()
+
+
+def enable_tracing(capacity=65536):
+    """ Start recording spans, keeping only the most recent capacity.
+    """
+    global _events
+    _events = _collections.deque(_events, maxlen=capacity)
+    if _originals:
+        return
+    for cls, names in TRACE_POINTS:
+        for name in names:
+            if name in cls.__dict__:
+                original = cls.__dict__[name]
+                _originals[(cls, name)] = original
+                label = "{}.{}".format(cls.__name__, name)
+                setattr(cls, name, _traced(label, original))
+
+
+def disable_tracing():
+    """ Stop recording spans. Recorded spans are kept until cleared.
+    """
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+@_contextlib.contextmanager
+def tracing(capacity=65536):
+    """ Trace everything within a with block.
+    """
+    enable_tracing(capacity)
+    try:
+        yield
+    finally:
+        disable_tracing()
+
+
+def clear_trace():
+    """ Forget every recorded span.
+    """
+    _events.clear()
+
+
+def trace_events():
+    """ The recorded spans, oldest first, as tuples of
+        (name, start_ns, duration_ns, depth, thread_id).
+    """
+    return list(_events)
+
+
+def _traced(label, function):
+    """ Wrap function so that each call is recorded as a span.
+    """
+    @_functools.wraps(function)
+    def traced(*args, **kwargs):
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        start = _time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = _time.perf_counter_ns() - start
+            _local.depth = depth
+            _events.append((label, start, duration, depth,
+                            _threading.get_ident()))
+    return traced
+
+
+class LatencyHistogram(object):
+    """ Latencies of one operation, in power-of-two nanosecond buckets.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+        self.buckets = _collections.Counter()
+
+    def add(self, duration_ns):
+        """ Record one call taking duration_ns.
+        """
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if self.max_ns is None or duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        # Keyed by the bucket's upper bound.
+        self.buckets[1 << duration_ns.bit_length()] += 1
+
+    @property
+    def mean_ns(self):
+        if self.count == 0:
+            return 0
+        return self.total_ns / self.count
+
+    def percentile(self, p):
+        """ The upper bound of the bucket holding the p-th percentile.
+        """
+        target = self.count * p / 100
+        seen = 0
+        for bound in sorted(self.buckets):
+            seen += self.buckets[bound]
+            if seen >= target:
+                return bound
+        return 0
+
+    def __str__(self):
+        lines = ["{}: {} calls, mean {:.0f} ns, max {} ns".format(
+            self.name, self.count, self.mean_ns, self.max_ns)]
+        widest = max(self.buckets.values(), default=0)
+        for bound in sorted(self.buckets):
+            n = self.buckets[bound]
+            bar = "#" * max(1, round(40 * n / widest))
+            lines.append("  < {:>12} ns {:>8} {}".format(bound, n, bar))
+        return "\n".join(lines)
+
+
+def latency_histograms():
+    """ Summarise the recorded spans as a LatencyHistogram per operation.
+    """
+    histograms = {}
+    for name, _, duration, _, _ in _events:
+        if name not in histograms:
+            histograms[name] = LatencyHistogram(name)
+        histograms[name].add(duration)
+    return histograms
+
+
+def export_chrome_trace(path=None):
+    """ Return the recorded spans as Chrome trace-event JSON, also writing
+        it to path if one is given.
+    """
+    pid = _os.getpid()
+    trace = {
+        "traceEvents": [{
+            "name": name,
+            "cat": "ZF",
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": duration / 1000,
+            "pid": pid,
+            "tid": thread,
+            "args": {"depth": depth},
+        } for name, start, duration, depth, thread in _events],
+        "displayTimeUnit": "ns",
+    }
+    text = _json.dumps(trace)
+    if path is not None:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+
+def _test_tracing():
+    with tracing():
+        print(Integer(-4) * Integer(3) + Ordinal(2))
+        print(String("Sets") + String("!"))
+    for histogram in latency_histograms().values():
+        print(histogram)
+    print(len(_json.loads(export_chrome_trace())["traceEvents"]))
+
+
+if __name__ == "__main__":
+    _test_tracing()
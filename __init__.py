@@ -7,6 +7,9 @@ but to be the most true to the underlying mathematics of ZF Set Theory.
 """
 
 from .Sets import *
+from .BitSets import *
 from .Structures import *
 from .Numbers import *
 from .Strings import *
+from .Expressions import *
+from .Tracing import *